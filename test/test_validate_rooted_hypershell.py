@@ -0,0 +1,229 @@
+"""Tests for the Lua definition index in validate_rooted_hypershell.py
+
+Run from the repository root with:
+    python3 -m unittest discover -s test -p 'test_*.py'
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import validate_rooted_hypershell as validate
+
+
+class TestClassDetection(unittest.TestCase):
+
+    def check(self, source, class_name):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scratch.lua')
+            with open(path, 'w') as f:
+                f.write(source)
+            return validate.check_class_exists(path, class_name)
+
+    def test_table_forms(self):
+        cases = [
+            ('local Foo = {}\n', 'Foo'),
+            ('Foo = {}\n', 'Foo'),
+            ('local Foo = {}  -- class table\n', 'Foo'),
+            ('local Foo = {} \n', 'Foo'),
+            ('Foo = {};\n', 'Foo'),
+            ('local Foo = { }\n', 'Foo'),
+        ]
+        for source, class_name in cases:
+            with self.subTest(source=source):
+                self.assertTrue(self.check(source, class_name))
+
+    def test_torch_class(self):
+        source = "local Foo, parent = torch.class('nn.Foo', 'nn.Module')\n"
+        self.assertTrue(self.check(source, 'Foo'))
+        self.assertTrue(self.check(source, 'nn.Foo'))
+
+    def test_indented_table_is_not_a_class(self):
+        source = 'function f()\n    local result = {}\nend\n'
+        self.assertFalse(self.check(source, 'result'))
+
+    def test_table_constructor_forms(self):
+        cases = [
+            'local Foo = {\n    x = 1,\n}\n',
+            'local Foo = setmetatable({}, {__index = Base})\n',
+            'Foo = Foo or {}\n',
+        ]
+        for source in cases:
+            with self.subTest(source=source):
+                self.assertTrue(self.check(source, 'Foo'))
+
+    def test_functions_and_classes_are_kept_apart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scratch.lua')
+            with open(path, 'w') as f:
+                f.write('function Foo()\nend\nlocal Bar = {}\n')
+            self.assertFalse(validate.check_class_exists(path, 'Foo'))
+            self.assertFalse(validate.check_function_exists(path, 'Bar'))
+            self.assertTrue(validate.check_function_exists(path, 'Foo'))
+            self.assertTrue(validate.check_class_exists(path, 'Bar'))
+
+
+class TestFunctionDetection(unittest.TestCase):
+
+    def functions(self, source):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scratch.lua')
+            with open(path, 'w') as f:
+                f.write(source)
+            return validate.find_functions(path, ['f', 'M:f', 'M.f'])
+
+    def test_definition_forms(self):
+        cases = [
+            ('function f()\nend\n', {'f'}),
+            ('local function f(x)\nend\n', {'f'}),
+            ('M.f = function(x)\nend\n', {'M.f', 'f'}),
+            ('local f = function (x)\nend\n', {'f'}),
+            ('function M:f(x)\nend\n', {'M:f', 'f'}),
+            ('function\tf()\nend\n', {'f'}),
+            ('local\tfunction  f()\nend\n', {'f'}),
+        ]
+        for source, expected in cases:
+            with self.subTest(source=source):
+                self.assertEqual(self.functions(source), expected)
+
+    def test_commented_out_definitions_are_ignored(self):
+        source = '-- function f()\n--[[ M.f = function() ]]\n-- local f = function()\n'
+        self.assertEqual(self.functions(source), set())
+
+    def test_calls_are_not_definitions(self):
+        source = 'local x = M:f(1)\nfunctional = 1\n'
+        self.assertEqual(self.functions(source), set())
+
+
+class TestReading(unittest.TestCase):
+
+    def test_undecodable_bytes_do_not_abort(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scratch.lua')
+            with open(path, 'wb') as f:
+                f.write(b'function foo()\nend\n\xff\xfe')
+            self.assertTrue(validate.check_function_exists(path, 'foo'))
+
+    def check_capped(self, source, cap, check):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scratch.lua')
+            with open(path, 'w') as f:
+                f.write(source)
+            old_cap = validate.MAX_READ_SIZE
+            validate.MAX_READ_SIZE = cap
+            try:
+                check(path)
+            finally:
+                validate.MAX_READ_SIZE = old_cap
+
+    def test_truncated_last_line_is_not_indexed(self):
+        source = 'function foo()\nend\nfunction getAbc()\nend\n'
+
+        def check(path):
+            self.assertTrue(validate.check_function_exists(path, 'foo'))
+            self.assertFalse(validate.check_function_exists(path, 'get'))
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                validate.check_file_exists(path, 'Scratch')
+            self.assertIn('Only the first', output.getvalue())
+
+        self.check_capped(source, source.index('getAbc') + len('get'), check)
+
+    def test_file_exactly_at_cap_is_read_in_full(self):
+        source = 'function foo()\nend\nfunction bar()'
+
+        def check(path):
+            self.assertTrue(validate.check_function_exists(path, 'bar'))
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                validate.check_file_exists(path, 'Scratch')
+            self.assertNotIn('Only the first', output.getvalue())
+
+        self.check_capped(source, len(source), check)
+
+    def report_for(self, path):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            found = validate.check_file_exists(path, 'Scratch')
+        return found, output.getvalue()
+
+    def test_directory_is_reported_unreadable(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            found, report = self.report_for(tmp)
+        self.assertFalse(found)
+        self.assertIn('NOT READABLE', report)
+        self.assertNotIn('NOT FOUND', report)
+
+    def test_missing_file_is_reported_not_found(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            found, report = self.report_for(os.path.join(tmp, 'missing.lua'))
+        self.assertFalse(found)
+        self.assertIn('NOT FOUND', report)
+
+
+class TestKeywords(unittest.TestCase):
+
+    def test_overlapping_keywords_are_all_credited(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'scratch.md')
+            with open(path, 'w') as f:
+                f.write('The RootedHypershell module.\n')
+            seen = validate.find_keywords(
+                path, ['RootedHypershell', 'Hypershell', 'Rooted', 'RootedTree'])
+            self.assertEqual(seen, {'RootedHypershell', 'Hypershell', 'Rooted'})
+
+
+class TestReport(unittest.TestCase):
+
+    def fake_validator(self, name, passed=True):
+        def validator():
+            print(f"section {name}")
+            sys.stdout.isatty()
+            return passed
+        return validator
+
+    def test_crashing_validator_fails_without_stopping_others(self):
+        def crash():
+            print("section Tests")
+            raise RuntimeError("boom")
+
+        names = {
+            'validate_rooted_tree': 'RootedTree',
+            'validate_hypershell': 'Hypershell',
+            'validate_rooted_hypershell': 'RootedHypershell',
+            'validate_examples': 'Examples',
+            'validate_documentation': 'Documentation',
+            'validate_integration': 'Integration',
+        }
+        with contextlib.ExitStack() as stack:
+            for attr, name in names.items():
+                stack.enter_context(
+                    mock.patch.object(validate, attr, self.fake_validator(name)))
+            stack.enter_context(mock.patch.object(validate, 'validate_tests', crash))
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                status = validate.main()
+
+        report = output.getvalue()
+        self.assertEqual(status, 1)
+        self.assertIn("Tests validator raised RuntimeError: boom", report)
+        self.assertRegex(report, r"Tests\s+: ✗ FAIL")
+        self.assertRegex(report, r"Integration\s+: ✓ PASS")
+        order = ['RootedTree', 'Hypershell', 'RootedHypershell', 'Tests',
+                 'Examples', 'Documentation', 'Integration']
+        positions = [report.index(f"section {name}") for name in order]
+        self.assertEqual(positions, sorted(positions))
+        self.assertLess(report.index("section Tests"),
+                        report.index("validator raised"))
+        self.assertLess(report.index("validator raised"),
+                        report.index("section Examples"))
+
+
+if __name__ == '__main__':
+    unittest.main()